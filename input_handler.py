@@ -25,6 +25,15 @@ class InputHandler:
         self.throttle_interval = 0.016  # ~60 FPS
         self.pending_mouse_move = None
         
+        # Scroll coalescing: sender accumulates deltas per flush tick,
+        # receiver carries the fractional remainder between events
+        self.scroll_lock = threading.Lock()
+        self.last_scroll_time = 0
+        self.pending_scroll = None
+        self.raw_scroll = False
+        self.scroll_remainder_x = 0.0
+        self.scroll_remainder_y = 0.0
+        
         # Shortcuts state
         self.pressed_keys = set()
         
@@ -90,15 +99,20 @@ class InputHandler:
         self.capturing = True
         logger.info("Starting input capture (suppressed)...")
         
+        self.reset_scroll_state()
+        
         # Stop hotkey listener to avoid double handling, 
         # but we need to detect toggle combo inside capture listener too to exit!
         self.stop_hotkey_listener()
         
+        raw_scroll_hooks = self._raw_scroll_hooks()
+        self.raw_scroll = bool(raw_scroll_hooks)
         self.capture_mouse_listener = mouse.Listener(
             on_move=self._on_mouse_move,
             on_click=self._on_mouse_click,
             on_scroll=self._on_mouse_scroll,
-            suppress=True
+            suppress=True,
+            **raw_scroll_hooks
         )
         self.capture_mouse_listener.start()
         
@@ -118,6 +132,7 @@ class InputHandler:
         if self.capture_mouse_listener:
             self.capture_mouse_listener.stop()
             self.capture_mouse_listener = None
+        self.raw_scroll = False
             
         if self.capture_key_listener:
             self.capture_key_listener.stop()
@@ -125,10 +140,58 @@ class InputHandler:
             
         # Clear state
         self.pressed_keys.clear()
+        self.reset_scroll_state()
         
         # Restart hotkey listener
         self.start_hotkey_listener()
 
+    def _raw_scroll_hooks(self):
+        """Platform listener hooks that read high-resolution scroll deltas.
+        
+        pynput reports scroll as whole ticks (Windows floor-divides by
+        WHEEL_DELTA, macOS reads the integer delta field), which drops or
+        distorts precision trackpad input. X11 only has button ticks, so
+        there is nothing finer to read there.
+        """
+        platform = __import__('sys').platform
+        if platform == 'win32':
+            return {'win32_event_filter': self._win32_scroll_filter}
+        if platform == 'darwin':
+            try:
+                import Quartz
+                self._quartz = Quartz
+                return {'darwin_intercept': self._darwin_scroll_intercept}
+            except ImportError:
+                logger.warning("Quartz not available, falling back to integer scroll deltas")
+        return {}
+
+    def _win32_scroll_filter(self, msg, data):
+        # WM_MOUSEWHEEL / WM_MOUSEHWHEEL carry a signed delta in the high word of mouseData
+        if msg in (0x020A, 0x020E):
+            import ctypes
+            delta = ctypes.c_short(data.mouseData >> 16).value / 120.0  # WHEEL_DELTA
+            if msg == 0x020A:
+                self._queue_scroll(0, delta)
+            else:
+                self._queue_scroll(delta, 0)
+
+    def _darwin_scroll_intercept(self, event_type, event):
+        Quartz = self._quartz
+        if event_type == Quartz.kCGEventScrollWheel:
+            # Fixed-point fields keep the fractional line delta of continuous scrolling
+            dy = Quartz.CGEventGetDoubleValueField(event, Quartz.kCGScrollWheelEventFixedPtDeltaAxis1)
+            dx = Quartz.CGEventGetDoubleValueField(event, Quartz.kCGScrollWheelEventFixedPtDeltaAxis2)
+            self._queue_scroll(dx, dy)
+        # Capture is suppressed, so never pass the event on
+        return None
+
+    def reset_scroll_state(self):
+        """Drop any pending scroll and fractional remainder when control changes hands."""
+        with self.scroll_lock:
+            self.pending_scroll = None
+            self.scroll_remainder_x = 0.0
+            self.scroll_remainder_y = 0.0
+
     def release_all_modifiers(self):
         """Force release of all modifier keys."""
         logger.info("Releasing all modifier keys...")
@@ -217,6 +280,9 @@ class InputHandler:
                     threading.Timer(self.throttle_interval, self._send_pending_mouse_move).start()
 
     def _on_mouse_click(self, x, y, button, pressed):
+        # Flush a collected scroll first so it keeps its order and is not lost on toggle
+        self._send_pending_scroll()
+        
         nx = x / self.screen_size[0]
         ny = y / self.screen_size[1]
         
@@ -236,12 +302,45 @@ class InputHandler:
             self.on_event({'type': 'mc', 'x': nx, 'y': ny, 'button': btn, 'pressed': pressed})
 
     def _on_mouse_scroll(self, x, y, dx, dy):
+        # The raw hook already queued this event with full precision
+        if self.raw_scroll:
+            return
+        self._queue_scroll(dx, dy)
+    
+    def _queue_scroll(self, dx, dy):
         # Apply scroll inversion
         processed_dx = -dx if self.invert_scroll_x else dx
         processed_dy = -dy if self.invert_scroll_y else dy
         
-        if self.on_event:
-            self.on_event({'type': 'ms', 'dx': processed_dx, 'dy': processed_dy})
+        if self.on_event and (processed_dx or processed_dy):
+            current_time = time.time()
+            with self.scroll_lock:
+                if self.pending_scroll:
+                    # Accumulate into the pending scroll until the timer flushes it
+                    self.pending_scroll['dx'] += processed_dx
+                    self.pending_scroll['dy'] += processed_dy
+                    return
+                send_now = current_time - self.last_scroll_time >= self.throttle_interval
+                if send_now:
+                    self.last_scroll_time = current_time
+                else:
+                    self.pending_scroll = {'dx': float(processed_dx), 'dy': float(processed_dy)}
+            if send_now:
+                # Send immediately
+                self.on_event({'type': 'ms', 'dx': processed_dx, 'dy': processed_dy})
+            else:
+                # Schedule sending the pending scroll after throttle interval
+                threading.Timer(self.throttle_interval, self._send_pending_scroll).start()
+    
+    def _send_pending_scroll(self):
+        """Send the accumulated scroll delta if there is one."""
+        with self.scroll_lock:
+            pending = self.pending_scroll
+            self.pending_scroll = None
+            if pending:
+                self.last_scroll_time = time.time()
+        if pending and self.on_event and (pending['dx'] or pending['dy']):
+            self.on_event({'type': 'ms', 'dx': pending['dx'], 'dy': pending['dy']})
     
     def _send_pending_mouse_move(self):
         """Send the pending mouse move event if there is one."""
@@ -253,6 +352,7 @@ class InputHandler:
                 self.pending_mouse_move = None
 
     def _on_key_press(self, key):
+        self._send_pending_scroll()
         if self._check_toggle(key, True):
             return # Don't send the toggle keys themselves if possible, or send them? 
                    # If we suppress, we don't send to OS. Protocol consumer shouldn't act on them locally?
@@ -264,6 +364,7 @@ class InputHandler:
             self.on_event({'type': 'kp', 'key': key_str, 'pressed': True})
 
     def _on_key_release(self, key):
+        self._send_pending_scroll()
         if self._check_toggle(key, False):
             return 
             
@@ -304,7 +405,17 @@ class InputHandler:
                 dy = data['dy']
                 processed_dx = -dx if self.invert_scroll_x else dx
                 processed_dy = -dy if self.invert_scroll_y else dy
-                self.mouse_controller.scroll(processed_dx, processed_dy)
+                
+                # Scroll whole steps only, carrying the fractional part over
+                with self.scroll_lock:
+                    self.scroll_remainder_x += processed_dx
+                    self.scroll_remainder_y += processed_dy
+                    steps_x = int(self.scroll_remainder_x)
+                    steps_y = int(self.scroll_remainder_y)
+                    self.scroll_remainder_x -= steps_x
+                    self.scroll_remainder_y -= steps_y
+                if steps_x or steps_y:
+                    self.mouse_controller.scroll(steps_x, steps_y)
                 
             elif etype == 'kp':
                 key_str = data['key']
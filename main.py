@@ -100,6 +100,7 @@ class ShareMouseApp:
         
         if etype == 'reset_modifiers':
             self.input_handler.release_all_modifiers()
+            self.input_handler.reset_scroll_state()
             
         elif etype == 'cb':
             # Clipboard update
@@ -0,0 +1,173 @@
+import os
+import sys
+import types
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class _FakeController:
+    def __init__(self):
+        self.scroll_calls = []
+
+    def scroll(self, dx, dy):
+        self.scroll_calls.append((dx, dy))
+
+
+class _FakeTimer:
+    """Records scheduled flushes instead of starting a real thread."""
+    def __init__(self, interval, function):
+        self.function = function
+
+    def start(self):
+        pass
+
+
+# Stub pynput before importing InputHandler so tests run without a display
+_pynput = types.ModuleType('pynput')
+_pynput.mouse = types.SimpleNamespace(Controller=_FakeController, Listener=None, Button=None)
+_pynput.keyboard = types.SimpleNamespace(Controller=_FakeController, Listener=None, Key=None)
+with mock.patch.dict(sys.modules, {'pynput': _pynput,
+                                   'pynput.mouse': _pynput.mouse,
+                                   'pynput.keyboard': _pynput.keyboard}):
+    sys.modules.pop('input_handler', None)
+    import input_handler
+    from input_handler import InputHandler
+
+
+WM_MOUSEWHEEL = 0x020A
+WM_MOUSEHWHEEL = 0x020E
+
+
+def _wheel_data(delta):
+    """Fake MSLLHOOKSTRUCT with a signed wheel delta in the high word of mouseData."""
+    return types.SimpleNamespace(mouseData=(delta & 0xFFFF) << 16)
+
+
+class ScrollCoalescingTest(unittest.TestCase):
+    TICKS = 250
+    # Precision touchpad deltas, pynput alone would floor these to 0 and -1
+    RAW_DX = -30
+    RAW_DY = 30
+
+    def _make_handler(self, **kwargs):
+        with mock.patch.object(InputHandler, '_get_screen_size', return_value=(1920, 1080)):
+            return InputHandler(**kwargs)
+
+    def _make_sender(self, sent, **kwargs):
+        sender = self._make_handler(on_event=sent.append, **kwargs)
+        sender.capturing = True
+        sender.raw_scroll = True
+        return sender
+
+    def _raw_burst(self, sender):
+        # All events land within one throttle interval
+        with mock.patch.object(input_handler.threading, 'Timer', _FakeTimer), \
+                mock.patch.object(input_handler.time, 'time', return_value=1000.0):
+            for _ in range(self.TICKS):
+                sender._win32_scroll_filter(WM_MOUSEHWHEEL, _wheel_data(self.RAW_DX))
+                sender._win32_scroll_filter(WM_MOUSEWHEEL, _wheel_data(self.RAW_DY))
+                # pynput's own integer callback must not be counted twice
+                sender._on_mouse_scroll(0, 0, -1, 0)
+        sender._send_pending_scroll()
+
+    def test_raw_burst_coalesces_with_full_precision(self):
+        for invert_x in (False, True):
+            for invert_y in (False, True):
+                with self.subTest(invert_x=invert_x, invert_y=invert_y):
+                    sent = []
+                    self._raw_burst(self._make_sender(sent, invert_scroll_x=invert_x,
+                                                      invert_scroll_y=invert_y))
+                    sign_x = -1 if invert_x else 1
+                    sign_y = -1 if invert_y else 1
+                    # First event goes out immediately, the rest in one flush
+                    self.assertEqual(len(sent), 2)
+                    self.assertTrue(all(e['type'] == 'ms' for e in sent))
+                    self.assertAlmostEqual(sum(e['dx'] for e in sent),
+                                           sign_x * self.TICKS * self.RAW_DX / 120)
+                    self.assertAlmostEqual(sum(e['dy'] for e in sent),
+                                           sign_y * self.TICKS * self.RAW_DY / 120)
+
+    def test_injection_preserves_distance_with_remainder(self):
+        for invert_x in (False, True):
+            for invert_y in (False, True):
+                with self.subTest(invert_x=invert_x, invert_y=invert_y):
+                    sent = []
+                    self._raw_burst(self._make_sender(sent, invert_scroll_x=invert_x,
+                                                      invert_scroll_y=invert_y))
+                    receiver = self._make_handler(invert_scroll_x=invert_x, invert_scroll_y=invert_y)
+                    for event in sent:
+                        receiver.inject_event(event)
+
+                    # Receiver inversion cancels sender inversion
+                    total_x = self.TICKS * self.RAW_DX / 120
+                    total_y = self.TICKS * self.RAW_DY / 120
+                    calls = receiver.mouse_controller.scroll_calls
+                    steps_x = sum(dx for dx, _ in calls)
+                    steps_y = sum(dy for _, dy in calls)
+                    self.assertTrue(all(isinstance(v, int) for call in calls for v in call))
+                    self.assertEqual(steps_x, int(total_x))
+                    self.assertEqual(steps_y, int(total_y))
+                    self.assertNotEqual(receiver.scroll_remainder_y, 0)
+                    self.assertAlmostEqual(steps_x + receiver.scroll_remainder_x, total_x)
+                    self.assertAlmostEqual(steps_y + receiver.scroll_remainder_y, total_y)
+
+    def test_integer_ticks_coalesce(self):
+        sent = []
+        sender = self._make_handler(on_event=sent.append, invert_scroll_y=True)
+        with mock.patch.object(input_handler.threading, 'Timer', _FakeTimer), \
+                mock.patch.object(input_handler.time, 'time', return_value=1000.0):
+            for _ in range(self.TICKS):
+                sender._on_mouse_scroll(0, 0, 0, 1)
+        sender._send_pending_scroll()
+        self.assertEqual(len(sent), 2)
+        self.assertEqual(sum(e['dy'] for e in sent), -self.TICKS)
+
+    def test_isolated_scroll_is_sent_immediately(self):
+        sent = []
+        sender = self._make_handler(on_event=sent.append)
+        with mock.patch.object(input_handler.threading, 'Timer', _FakeTimer):
+            sender._on_mouse_scroll(0, 0, 0, 1)
+        self.assertEqual(sent, [{'type': 'ms', 'dx': 0, 'dy': 1}])
+        self.assertIsNone(sender.pending_scroll)
+
+    def test_click_flushes_pending_scroll_first(self):
+        sent = []
+        sender = self._make_sender(sent)
+        with mock.patch.object(input_handler.threading, 'Timer', _FakeTimer), \
+                mock.patch.object(input_handler.time, 'time', return_value=1000.0):
+            sender._win32_scroll_filter(WM_MOUSEWHEEL, _wheel_data(120))
+            sender._win32_scroll_filter(WM_MOUSEWHEEL, _wheel_data(30))
+            sender._on_mouse_click(0, 0, 'Button.left', True)
+        self.assertEqual([e['type'] for e in sent], ['ms', 'ms', 'mc'])
+
+    def test_toggle_click_flushes_pending_scroll(self):
+        sent = []
+        sender = self._make_sender(sent)
+        sender.on_toggle = sender.stop_capture
+        with mock.patch.object(input_handler.threading, 'Timer', _FakeTimer), \
+                mock.patch.object(input_handler.time, 'time', return_value=1000.0), \
+                mock.patch.object(InputHandler, 'start_hotkey_listener'):
+            sender._win32_scroll_filter(WM_MOUSEWHEEL, _wheel_data(120))
+            sender._win32_scroll_filter(WM_MOUSEWHEEL, _wheel_data(30))
+            sender._on_mouse_click(0, 0, 'Button.middle', True)
+        self.assertAlmostEqual(sum(e['dy'] for e in sent), 1.25)
+        self.assertFalse(sender.capturing)
+
+    def test_stop_capture_drops_pending_scroll(self):
+        sent = []
+        sender = self._make_sender(sent)
+        with mock.patch.object(input_handler.threading, 'Timer', _FakeTimer), \
+                mock.patch.object(input_handler.time, 'time', return_value=1000.0), \
+                mock.patch.object(InputHandler, 'start_hotkey_listener'):
+            sender._win32_scroll_filter(WM_MOUSEWHEEL, _wheel_data(120))
+            sender._win32_scroll_filter(WM_MOUSEWHEEL, _wheel_data(30))
+            sender.stop_capture()
+        sender._send_pending_scroll()
+        self.assertEqual(len(sent), 1)
+        self.assertIsNone(sender.pending_scroll)
+
+
+if __name__ == '__main__':
+    unittest.main()